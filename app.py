@@ -3,29 +3,34 @@ import home, topics, user_guide
 import base64
 from pathlib import Path
 
-# Convert leaf icon to base64 for favicon
-leaf_icon = base64.b64encode(Path("seeds_leaf.png").read_bytes()).decode()
+# Read static assets once per process instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def _image_data_uri(path):
+    return "data:image/png;base64," + base64.b64encode(Path(path).read_bytes()).decode()
+
+@st.cache_resource(show_spinner=False)
+def _css_text(path):
+    return Path(path).read_text(encoding="utf-8")
 
 st.set_page_config(
-    page_title="SEEDS Dashboard", 
-    page_icon=f"data:image/png;base64,{leaf_icon}",
-    layout="wide", 
+    page_title="SEEDS Dashboard",
+    page_icon=_image_data_uri("seeds_leaf.png"),
+    layout="wide",
     initial_sidebar_state="expanded"
 )
 
 def inject_css(path="style.css"):
-    st.markdown(f"<style>{Path(path).read_text(encoding='utf-8')}</style>", unsafe_allow_html=True)
+    st.markdown(f"<style>{_css_text(path)}</style>", unsafe_allow_html=True)
 
 if "page" not in st.session_state:
     st.session_state.page = "Home"
 
 inject_css()
 def sidebar_logo(path="seeds_logo.png"):
-    b64 = base64.b64encode(Path(path).read_bytes()).decode()
     st.sidebar.markdown(
         f"""
         <div class="sb-logo-wrap">
-          <img class="sb-logo" src="data:image/png;base64,{b64}" alt="SEEDS Dashboard">
+          <img class="sb-logo" src="{_image_data_uri(path)}" alt="SEEDS Dashboard">
         </div>
         """,
         unsafe_allow_html=True,
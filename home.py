@@ -3,15 +3,24 @@ import pandas as pd
 import numpy as np
 import json
 import plotly.express as px
-from sklearn.preprocessing import MinMaxScaler
+import scipy.sparse as sp
+from sklearn.cluster import MiniBatchKMeans
 
-# Try UMAP first; fall back to PCA if unavailable
+# Try GPU UMAP (cuML) first, then CPU UMAP; fall back to PCA if unavailable
 try:
-    from umap.umap_ import UMAP
-    _USE_UMAP = True
+    import cupy
+    import cupyx.scipy.sparse
+    from cuml.manifold import UMAP
+    if cupy.cuda.runtime.getDeviceCount() < 1:
+        raise ImportError("no CUDA device")
+    _USE_UMAP, _USE_GPU = True, True
 except Exception:
-    from sklearn.decomposition import PCA
-    _USE_UMAP = False
+    try:
+        from umap.umap_ import UMAP
+        _USE_UMAP, _USE_GPU = True, False
+    except Exception:
+        from sklearn.decomposition import PCA
+        _USE_UMAP = _USE_GPU = False
 
 @st.cache_data
 def load_docs3d():
@@ -36,51 +45,111 @@ def load_sources():
         blogs = pd.DataFrame()
     return topics, topic_labels, topic_data, blogs
 
+@st.cache_data(persist="disk", show_spinner="Computing 3D embedding…")
+def compute_embedding(topic_data_json):
+    """Build the keyword matrix and reduce it to 3D, once per dataset.
+
+    Takes the serialized topic data (a plain string) so Streamlit can hash
+    the input; the stochastic UMAP/PCA fit then only runs on a cache miss
+    instead of on every rerun of the script. Persisting to disk keeps the
+    result across worker restarts, so only the very first launch pays for
+    the fit.
+    """
+    topic_data = json.loads(topic_data_json)
+    X, topic_ids, top5 = _build_topic_matrix(topic_data)
+    if X.nnz == 0:
+        return [], [], None
+
+    # For large topic counts, coarsen first so UMAP's k-NN graph stays small.
+    assignments = None
+    if X.shape[0] > 500:
+        X, assignments = _coarsen(X)
+
+    if _USE_UMAP:
+        reducer = UMAP(n_neighbors=5, n_components=3, min_dist=0.0, metric="cosine", random_state=42)
+        if _USE_GPU:
+            X_gpu = (cupyx.scipy.sparse.csr_matrix(X) if sp.issparse(X)
+                     else cupy.asarray(X, dtype=cupy.float32))
+            reduced = cupy.asnumpy(reducer.fit_transform(X_gpu))
+        else:
+            reduced = reducer.fit_transform(X)
+    else:
+        reducer = PCA(n_components=3, random_state=42)
+        # PCA has no sparse support; the fallback matrix is small enough to densify.
+        reduced = reducer.fit_transform(X.toarray() if sp.issparse(X) else X)
+
+    if assignments is not None:
+        reduced = reduced[assignments]
+    return topic_ids, top5, reduced
+
+def _coarsen(X, target_n=512):
+    """Cluster rows down to at most `target_n` representatives.
+
+    Returns the cluster centroids plus the row->centroid assignment so the
+    reduced coordinates can be scattered back to every original row.
+    """
+    km = MiniBatchKMeans(n_clusters=min(target_n, X.shape[0]), random_state=42, n_init="auto")
+    assignments = km.fit_predict(X)
+    return km.cluster_centers_.astype(X.dtype, copy=False), assignments
+
 def _build_topic_matrix(topic_data):
     vocab = sorted({kw for item in topic_data for kw, _ in item.get("keywords", [])})
     if not vocab:
-        return np.zeros((0, 0), dtype=float), [], []
+        return sp.csr_matrix((0, 0), dtype=np.float32), [], []
     idx = {kw: i for i, kw in enumerate(vocab)}
 
-    rows, topic_ids, top5 = [], [], []
+    # Collect coordinates once for a single CSR construction; each topic
+    # only touches a handful of keywords, so the matrix is extremely sparse
+    # and the k-NN search inside UMAP is much cheaper on CSR input.
+    row_idx, col_idx, vals = [], [], []
+    topic_ids, top5 = [], []
     for item in topic_data:
         t = item.get("topic_number")
         if t is None:
             continue
-        vec = np.zeros(len(vocab), dtype=float)
+        r = len(topic_ids)
         kws = item.get("keywords", [])
         for kw, score in kws:
             if kw in idx:
                 try:
-                    vec[idx[kw]] = float(score)
+                    score = float(score)
                 except Exception:
-                    vec[idx[kw]] = 0.0
-        rows.append(vec)
+                    score = 0.0
+                row_idx.append(r)
+                col_idx.append(idx[kw])
+                vals.append(score)
         topic_ids.append(int(t))
         top5.append(", ".join([kw for kw, _ in kws[:5]]) if kws else "")
 
-    X = np.vstack(rows) if rows else np.zeros((0, len(vocab)))
+    rows = np.fromiter(row_idx, dtype=np.int32, count=len(row_idx))
+    cols = np.fromiter(col_idx, dtype=np.int32, count=len(col_idx))
+    data = np.fromiter(vals, dtype=np.float32, count=len(vals))
+    X = sp.csr_matrix((data, (rows, cols)), shape=(len(topic_ids), len(vocab)), dtype=np.float32)
     return X, topic_ids, top5
 
 def _topic_sizes(topic_ids, topics_df, blogs_df, labels_map):
     if not topics_df.empty:
         count_col = "Frequency" if "Frequency" in topics_df.columns else topics_df.columns[-1]
-        totals = topics_df.groupby("Topic")[count_col].sum()
-        raw = [float(totals.get(t, 1.0)) for t in topic_ids]
+        raw = (topics_df.groupby("Topic")[count_col].sum()
+               .reindex(topic_ids, fill_value=1.0)
+               .to_numpy(dtype=np.float32))
     elif not blogs_df.empty and "topic_label" in blogs_df.columns:
         per_label = blogs_df["topic_label"].value_counts()
-        raw = [float(per_label.get(labels_map.get(str(t), str(t)), 1.0)) for t in topic_ids]
+        labels = [labels_map.get(str(t), str(t)) for t in topic_ids]
+        raw = per_label.reindex(labels, fill_value=1.0).to_numpy(dtype=np.float32)
     else:
-        raw = [1.0 for _ in topic_ids]
+        raw = np.ones(len(topic_ids), dtype=np.float32)
 
-    sizes = MinMaxScaler((8, 28)).fit_transform(np.array(raw).reshape(-1, 1)).ravel()
+    # Affine rescale into the [8, 28] marker-size range.
+    mn, mx = raw.min(), raw.max()
+    sizes = 8 + 20 * (raw - mn) / max(mx - mn, 1e-9)
     return sizes
 
-def _color_map(labels):
-    green_palette = ['#2ecc40', '#27ae60', '#16a085', '#229954', '#1e8449', '#239b56', '#28b463', '#58d68d']
-    cats = pd.Series(labels).astype(str).unique().tolist()
-    return {lab: green_palette[i % len(green_palette)] for i, lab in enumerate(cats)}
+# Shared green palette; used as a continuous scale over integer label codes so
+# Plotly emits a single trace instead of one trace (and draw batch) per topic.
+green_palette = ['#2ecc40', '#27ae60', '#16a085', '#229954', '#1e8449', '#239b56', '#28b463', '#58d68d']
 
+@st.fragment
 def show():
     # --- Intro Section ---
     st.markdown("<h1 style='color:green;'>SEEDS Dashboard</h1>", unsafe_allow_html=True)
@@ -125,24 +194,24 @@ def show():
             st.error("`docs_3d.csv` must include columns x, y, z (and optionally size, label, Title).")
             return
 
-        cmap = _color_map(df['label'] if 'label' in df.columns else [])
         hover_cols = {}
         if 'Title' in df.columns:
             hover_cols['Title'] = True
         if 'label' in df.columns:
             hover_cols['label'] = True
 
+        codes = pd.factorize(df['label'].astype(str))[0] if 'label' in df.columns else None
         fig = px.scatter_3d(
             df,
             x='x', y='y', z='z',
             size=df['size'] if 'size' in df.columns else None,
-            color='label' if 'label' in df.columns else None,
+            color=codes,
             hover_data=hover_cols,
-            color_discrete_map=cmap if 'label' in df.columns else None,
+            color_continuous_scale=green_palette,
             labels={'label': 'Topic'}
         )
         fig.update_traces(marker=dict(line=dict(width=0.5, color='black')))
-        fig.update_layout(showlegend=True, margin=dict(l=0, r=0, b=0, t=40), height=640)
+        fig.update_layout(coloraxis_showscale=False, margin=dict(l=0, r=0, b=0, t=40), height=640)
         st.plotly_chart(fig, use_container_width=True)
         return
 
@@ -152,18 +221,11 @@ def show():
         st.error("No 3D data available. Provide `docs_3d.csv` (preferred) or include `topic_data.json`.")
         return
 
-    X, topic_ids, top5 = _build_topic_matrix(topic_data)
-    if X.shape[0] == 0:
+    topic_ids, top5, reduced = compute_embedding(json.dumps(topic_data, sort_keys=True))
+    if reduced is None:
         st.error("No keyword vectors could be built from `topic_data.json`.")
         return
 
-    if _USE_UMAP:
-        reducer = UMAP(n_neighbors=5, n_components=3, min_dist=0.0, metric="cosine", random_state=42)
-        reduced = reducer.fit_transform(X)
-    else:
-        reducer = PCA(n_components=3, random_state=42)
-        reduced = reducer.fit_transform(X)
-
     sizes = _topic_sizes(topic_ids, topics_df, blogs_df, labels_map)
     labels = [labels_map.get(str(t), str(t)) for t in topic_ids]
 
@@ -177,19 +239,19 @@ def show():
         "TopKeywords": top5,
     })
 
-    cmap = _color_map(df['label'])
+    codes = pd.factorize(df['label'])[0]
     fig = px.scatter_3d(
         df,
         x="x", y="y", z="z",
         size="size",
-        color="label",
+        color=codes,
         hover_data={"label": True, "TopKeywords": True, "Topic_ID": True},
-        color_discrete_map=cmap,
+        color_continuous_scale=green_palette,
         title="🌿 3D Topic Map from Keyword Weights",
         labels={"label": "Topic"}
     )
     fig.update_traces(marker=dict(line=dict(width=0.5, color="black")))
-    fig.update_layout(showlegend=True, margin=dict(l=0, r=0, b=0, t=40), height=640)
+    fig.update_layout(coloraxis_showscale=False, margin=dict(l=0, r=0, b=0, t=40), height=640)
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -1,6 +1,6 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 from wordcloud import WordCloud
 from html import escape
 from pathlib import Path
@@ -11,8 +11,12 @@ import base64
 @st.cache_data
 def load_data():
     try:
-        blogs = pd.read_csv("blogs.csv")
-        topics = pd.read_csv("topics.csv")
+        # Parse dates and set compact dtypes once here, so show() never
+        # re-runs pd.to_datetime on a filter change.
+        blogs = pd.read_csv("blogs.csv", dtype={'topic_label': 'category', 'author': 'category'})
+        topics = pd.read_csv("topics.csv", parse_dates=['Timestamp'])
+        if 'Timestamp' in topics.columns:
+            topics['Year'] = topics['Timestamp'].dt.year.astype('int16')
         with open("topic_labels.json", "r") as f:
             topic_labels = json.load(f)
         try:
@@ -26,6 +30,42 @@ def load_data():
         st.error("Data files not found. Please make sure 'blogs.csv', 'topics.csv', 'topic_labels.json' and 'topic_data.json' are in the same directory.")
         return None, None, None, None
 
+@st.cache_data(max_entries=32)
+def render_wordcloud(text: str) -> np.ndarray:
+    """Lay out the word cloud once per distinct text selection.
+
+    Returns the RGBA array rather than the WordCloud object so the result
+    pickles cleanly into Streamlit's cache.
+    """
+    return WordCloud(
+        width=800,
+        height=800,
+        background_color="white",
+        colormap="Greens",
+        max_words=200,
+        collocations=False,
+        random_state=42
+    ).generate(text).to_array()
+
+@st.cache_data
+def _topic_data_by_num(topic_data):
+    """Index topic_data by topic_number for O(1) lookups in the charts."""
+    return {item['topic_number']: item for item in topic_data if 'topic_number' in item}
+
+@st.cache_data
+def _topic_years(topics_df):
+    return np.sort(topics_df['Year'].unique())
+
+@st.cache_data
+def _topic_label_index(blogs):
+    """Inverted index: topic_label -> blog row positions."""
+    return blogs.groupby('topic_label', observed=True).indices
+
+@st.cache_data
+def _topic_number_index(topics_df):
+    """Inverted index: Topic number -> topics-over-time row positions."""
+    return topics_df.groupby('Topic').indices
+
 # Load once at import (uses Streamlit cache)
 blogs, topics_df, topic_labels_dict, topic_data = load_data()
 if blogs is None:
@@ -34,22 +74,133 @@ if blogs is None:
 # Shared green palette
 green_palette = ['#2ecc40', '#27ae60', '#16a085', '#229954', '#1e8449', '#239b56', '#28b463', '#58d68d']
 
-# Encode link icon (fallback to a unicode if file missing)
-# Encode link icon (no fallback)
-with open("link.png", "rb") as image_file:
-    encoded_link_icon = base64.b64encode(image_file.read()).decode()
-link_icon_html = f'<img src="data:image/png;base64,{encoded_link_icon}" alt="Link" width="16" style="vertical-align:-3px;">'
+# Read static assets once per process instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def _image_data_uri(path: str) -> str:
+    return "data:image/png;base64," + base64.b64encode(Path(path).read_bytes()).decode()
 
-# Encode seeds_leaf.png as base64 for inline HTML display
-with open("seeds_leaf.png", "rb") as img_file:
-    encoded_leaf_icon = base64.b64encode(img_file.read()).decode()
-leaf_icon_html = f'<img src="data:image/png;base64,{encoded_leaf_icon}" alt="Leaf" width="38" style="vertical-align:-10px; margin-right:10px;">'
+@st.cache_resource(show_spinner=False)
+def _css_text(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+link_icon_html = f'<img src="{_image_data_uri("link.png")}" alt="Link" width="16" style="vertical-align:-3px;">'
+leaf_icon_html = f'<img src="{_image_data_uri("seeds_leaf.png")}" alt="Leaf" width="38" style="vertical-align:-10px; margin-right:10px;">'
 
 
 def inject_css(path: str = "style.css") -> None:
-    css = Path(path).read_text(encoding="utf-8")
-    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+    st.markdown(f"<style>{_css_text(path)}</style>", unsafe_allow_html=True)
+
+# Figure builders are memoized on the filter state, so re-selecting a prior
+# combination skips both the data work and Plotly's JSON serialization.
+@st.cache_resource(max_entries=64)
+def build_bar_fig(topic_tuple):
+    """Top-10 keyword bar chart for a sorted tuple of topic numbers."""
+    topic_data_by_num = _topic_data_by_num(topic_data)
+    keyword_frames = [
+        pd.DataFrame(topic_data_by_num[t]['keywords'], columns=['Keyword', 'Score'])
+        for t in topic_tuple
+        if topic_data_by_num.get(t, {}).get('keywords')
+    ]
+    if not keyword_frames:
+        return None
+
+    # nlargest uses a partial sort, so only the top 10 get ordered
+    keywords_df = (
+        pd.concat(keyword_frames, ignore_index=True)
+        .groupby('Keyword', sort=False)['Score'].sum()
+        .nlargest(10)
+        .reset_index()
+    )
+    fig_bar = px.bar(
+        keywords_df,
+        x='Score', y='Keyword', orientation='h', title='Top 10 Keywords',
+        color='Keyword', color_discrete_sequence=green_palette
+    )
+    fig_bar.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        plot_bgcolor='#f8fff8',
+        paper_bgcolor='#f8fff8',
+        margin=dict(l=10, r=10, b=10, t=30),
+        showlegend=False,
+        height=440
+    )
+    return fig_bar
+
+@st.cache_resource(max_entries=64)
+def build_pie_fig(label_tuple):
+    """Author pie chart for a sorted tuple of topic labels."""
+    label_idx = _topic_label_index(blogs)
+    positions = [label_idx[l] for l in label_tuple if l in label_idx]
+    articles = blogs.iloc[np.sort(np.concatenate(positions))] if positions else blogs.iloc[0:0]
+    if articles.empty or 'author' not in articles.columns:
+        return None
+
+    # single-author blogs get folded into "Others" in one pass
+    vc = articles['author'].value_counts()
+    mask = vc > 1
+    pie_chart_data = vc[mask].rename_axis('Author').reset_index(name='Count')
+    others_count = int(vc[~mask].sum())
+    if others_count > 0:
+        others_row = pd.DataFrame([{'Author': 'Others', 'Count': others_count}])
+        pie_chart_data = pd.concat([pie_chart_data, others_row], ignore_index=True)
+    if pie_chart_data.empty:
+        return None
+
+    fig_pie = px.pie(
+        pie_chart_data,
+        names='Author',
+        values='Count',
+        color_discrete_sequence=green_palette
+    )
+    # let the pie fill the column and reduce wasted padding
+    fig_pie.update_traces(
+        textposition='inside',
+        textinfo='label',
+        insidetextorientation='radial',
+        marker=dict(line=dict(width=2))
+    )
+    fig_pie.update_layout(
+        height=440,                     # bigger than bar (340) & WC; feels dominant
+        margin=dict(l=0, r=0, t=30, b=0),
+        showlegend=False,
+        plot_bgcolor='#f8fff8',
+        paper_bgcolor='#f8fff8'
+    )
+    return fig_pie
+
+@st.cache_resource(max_entries=64)
+def build_line_fig(topic_tuple, start_year, end_year):
+    """Topic-growth line chart for a sorted tuple of topic numbers and a year range."""
+    topic_idx = _topic_number_index(topics_df)
+    positions = [topic_idx[t] for t in topic_tuple if t in topic_idx]
+    over_time = (topics_df.iloc[np.sort(np.concatenate(positions))].copy()
+                 if positions else topics_df.iloc[0:0].copy())
+
+    if start_year is not None and end_year is not None and not over_time.empty:
+        over_time = over_time[over_time['Year'].between(start_year, end_year)]
+    if over_time.empty:
+        return None
+
+    over_time['Topic_Label'] = over_time['Topic'].map(
+        lambda x: topic_labels_dict.get(str(x), str(x))
+    )
+    count_col = 'Frequency' if 'Frequency' in over_time.columns else over_time.columns[-2]
+    fig_line = px.line(
+        over_time, x='Timestamp', y=count_col, color='Topic_Label',
+        color_discrete_sequence=green_palette
+    )
+    fig_line.update_traces(mode='lines+markers')
+    fig_line.update_layout(
+        plot_bgcolor='#eafaf1',
+        paper_bgcolor='#eafaf1',
+        margin=dict(l=10, r=10, b=10, t=30),
+        height=420
+    )
+    return fig_line
 
+# Rendered as a fragment so filter interactions rerun only this page,
+# not the whole script (sidebar, other pages' module work, etc.).
+@st.fragment
 def show():
     inject_css()
     st.markdown(
@@ -71,9 +222,7 @@ def show():
 
     with col_years:
         if not topics_df.empty and 'Timestamp' in topics_df.columns:
-            topics_df['Timestamp'] = pd.to_datetime(topics_df['Timestamp'])
-            years = topics_df['Timestamp'].dt.year.unique()
-            years.sort()
+            years = _topic_years(topics_df)
             c1, c2 = st.columns(2)
             with c1:
                 start_year = st.selectbox("Start Year", options=years, index=0)
@@ -92,15 +241,15 @@ def show():
         if label in selected_topic_labels
     ]
 
-    selected_articles_df = blogs[blogs['topic_label'].isin(selected_topic_labels)].copy()
-    selected_topics_over_time_df = topics_df[topics_df['Topic'].isin(selected_topic_numbers)].copy()
+    # O(selected) row lookups via precomputed indices instead of full-table isin scans
+    label_idx = _topic_label_index(blogs)
+    positions = [label_idx[l] for l in selected_topic_labels if l in label_idx]
+    selected_articles_df = (blogs.iloc[np.sort(np.concatenate(positions))].copy()
+                            if positions else blogs.iloc[0:0].copy())
 
-    if start_year is not None and end_year is not None and not selected_topics_over_time_df.empty:
-        selected_topics_over_time_df['Timestamp'] = pd.to_datetime(selected_topics_over_time_df['Timestamp'])
-        selected_topics_over_time_df = selected_topics_over_time_df[
-            (selected_topics_over_time_df['Timestamp'].dt.year >= start_year) &
-            (selected_topics_over_time_df['Timestamp'].dt.year <= end_year)
-        ]
+    # Hashable filter-state keys for the memoized figure builders
+    topic_key = tuple(sorted(selected_topic_numbers))
+    label_key = tuple(sorted(selected_topic_labels))
 
     # --------------- Row 1 (3 charts) ---------------
     col_wc, col_bar, col_pie = st.columns([1.05, 1.05, 1.35])
@@ -110,115 +259,32 @@ def show():
         st.markdown("<h3 class='section-title'>The Green Cloud</h3>", unsafe_allow_html=True)
         topic_text = " ".join(selected_articles_df['body'].dropna().tolist())
         if topic_text.strip():
-            wc = WordCloud(
-                width=800,
-                height=800,
-                background_color="white",
-                colormap="Greens",
-                max_words=200,
-                collocations=False,
-                random_state=42
-            ).generate(topic_text)
-
-            fig, ax = plt.subplots(figsize=(4, 4))
-            ax.imshow(wc, interpolation="bilinear")
-            ax.axis("off")
-            st.pyplot(fig, use_container_width=True)
+            st.image(render_wordcloud(topic_text), use_container_width=True)
         else:
             st.info("No text available to generate a word cloud for these topics.")
 
     # Horizontal Bar Chart
     with col_bar:
         st.markdown("<h3 class='section-title'>Top 10 Keywords</h3>", unsafe_allow_html=True)
-        keywords_list = []
-        for topic_number in selected_topic_numbers:
-            selected_topic_data_item = next((item for item in topic_data if item.get('topic_number') == topic_number), None)
-            if selected_topic_data_item and selected_topic_data_item.get('keywords'):
-                keywords_list.extend(selected_topic_data_item['keywords'])
-
-        if keywords_list:
-            keywords_df = pd.DataFrame(keywords_list, columns=['Keyword', 'Score'])
-            keywords_df = keywords_df.groupby('Keyword', as_index=False)['Score'].sum().sort_values('Score', ascending=False)
-            fig_bar = px.bar(
-                keywords_df.head(10),
-                x='Score', y='Keyword', orientation='h', title='Top 10 Keywords',
-                color='Keyword', color_discrete_sequence=green_palette
-            )
-            fig_bar.update_layout(
-                yaxis={'categoryorder': 'total ascending'},
-                plot_bgcolor='#f8fff8',
-                paper_bgcolor='#f8fff8',
-                margin=dict(l=10, r=10, b=10, t=30),
-                showlegend=False,
-                height=440
-            )
+        fig_bar = build_bar_fig(topic_key)
+        if fig_bar is not None:
             st.plotly_chart(fig_bar, use_container_width=True)
         else:
             st.info("No keywords found for these topics.")
 
-  
     # Pie Chart
     with col_pie:
         st.markdown("<h3 class='section-title'>Top Voices</h3>", unsafe_allow_html=True)
-        if not selected_articles_df.empty and 'author' in selected_articles_df.columns:
-            author_counts = selected_articles_df['author'].value_counts().reset_index()
-            author_counts.columns = ['Author', 'Count']
-
-            # keep your "Others" aggregation logic
-            top_authors_df = author_counts[author_counts['Count'] > 1].copy()
-            others_count = author_counts[author_counts['Count'] == 1]['Count'].sum()
-            if others_count > 0:
-                others_row = pd.DataFrame([{'Author': 'Others', 'Count': others_count}])
-                pie_chart_data = pd.concat([top_authors_df, others_row], ignore_index=True)
-            else:
-                pie_chart_data = top_authors_df
-
-            if not pie_chart_data.empty:
-                fig_pie = px.pie(
-                    pie_chart_data,
-                    names='Author',
-                    values='Count',
-                    color_discrete_sequence=green_palette
-                )
-                # let the pie fill the column and reduce wasted padding
-                fig_pie.update_traces(
-                    textposition='inside',
-                    textinfo='label',
-                    insidetextorientation='radial',
-                    marker=dict(line=dict(width=2))
-                )
-                fig_pie.update_layout(
-                    height=440,                     # bigger than bar (340) & WC; feels dominant
-                    margin=dict(l=0, r=0, t=30, b=0),
-                    showlegend=False,
-                    plot_bgcolor='#f8fff8',
-                    paper_bgcolor='#f8fff8'
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)  # key change: responsive width
-            else:
-                st.info("No author data available to display a pie chart for these topics.")
+        fig_pie = build_pie_fig(label_key)
+        if fig_pie is not None:
+            st.plotly_chart(fig_pie, use_container_width=True)  # key change: responsive width
         else:
-            st.info("No blogs available to display author distribution for these topics.")
-
+            st.info("No author data available to display a pie chart for these topics.")
 
     # --------------- Row 2 (Line) ---------------
     st.markdown("<h3 class='section-title'>Topic Growth Over Time</h3>", unsafe_allow_html=True)
-    if not selected_topics_over_time_df.empty:
-        selected_topics_over_time_df['Topic_Label'] = selected_topics_over_time_df['Topic'].map(
-            lambda x: topic_labels_dict.get(str(x), str(x))
-        )
-        count_col = 'Frequency' if 'Frequency' in selected_topics_over_time_df.columns else selected_topics_over_time_df.columns[-2]
-        fig_line = px.line(
-            selected_topics_over_time_df, x='Timestamp', y=count_col, color='Topic_Label',
-            color_discrete_sequence=green_palette
-        )
-        fig_line.update_traces(mode='lines+markers')
-        fig_line.update_layout(
-            plot_bgcolor='#eafaf1',
-            paper_bgcolor='#eafaf1',
-            margin=dict(l=10, r=10, b=10, t=30),
-            height=420
-        )
+    fig_line = build_line_fig(topic_key, start_year, end_year)
+    if fig_line is not None:
         st.plotly_chart(fig_line, use_container_width=True)
     else:
         st.info("No topic growth data available for these topics.")
@@ -230,30 +296,34 @@ def show():
     blog_table_df = selected_articles_df[['title', 'author', 'organisation', 'published_year', 'url']].head(10).copy()
     blog_table_df.index = range(1, len(blog_table_df) + 1)
 
-    # tidy + rename (sanitation only)
-    blog_table_df = blog_table_df.fillna("").astype(str).applymap(lambda s: s.strip())
-    blog_table_df.loc[blog_table_df["organisation"].fillna("").astype(str).str.strip() == "", "organisation"] = "Independent Author"
+    # tidy + rename (sanitation only) — vectorized str.strip, no per-cell lambda
+    blog_table_df = blog_table_df.astype("string").fillna("")
+    for c in blog_table_df.columns:
+        blog_table_df[c] = blog_table_df[c].str.strip()
+    blog_table_df.loc[blog_table_df["organisation"] == "", "organisation"] = "Independent Author"
     blog_table_df.columns = ["Title", "Author", "Organisation", "Year", "URL"]
 
-    # Build HTML rows
-    rows_html = []
-    for i, row in blog_table_df.iterrows():
-        title = escape(row["Title"])
-        author = escape(row["Author"])
-        org = escape(row["Organisation"])
-        year = escape(row["Year"])
-        url = row["URL"].strip()
-        link_html = f"<a class='seeds-link' href='{escape(url)}' target='_blank' rel='noopener'>{link_icon_html}</a>" if url else ""
-        rows_html.append(
-            f"<tr>"
-            f"<td class='idx'>{i}</td>"
-            f"<td>{title}</td>"
-            f"<td>{author}</td>"
-            f"<td>{org}</td>"
-            f"<td>{year}</td>"
-            f"<td>{link_html}</td>"
-            f"</tr>"
-        )
+    # Build HTML rows with vectorized string concatenation (no iterrows)
+    urls = blog_table_df["URL"]
+    links = pd.Series(
+        np.where(
+            urls != "",
+            "<a class='seeds-link' href='" + urls.map(escape) + "' target='_blank' rel='noopener'>" + link_icon_html + "</a>",
+            ""
+        ),
+        index=blog_table_df.index
+    )
+    row_numbers = pd.Series(blog_table_df.index.astype(str), index=blog_table_df.index)
+    rows_html = (
+        "<tr>"
+        "<td class='idx'>" + row_numbers + "</td>"
+        "<td>" + blog_table_df["Title"].map(escape) + "</td>"
+        "<td>" + blog_table_df["Author"].map(escape) + "</td>"
+        "<td>" + blog_table_df["Organisation"].map(escape) + "</td>"
+        "<td>" + blog_table_df["Year"].map(escape) + "</td>"
+        "<td>" + links + "</td>"
+        "</tr>"
+    ).str.cat(sep="")
 
     table_html = f"""
     <div class="panel seeds-table-wrapper">
@@ -269,7 +339,7 @@ def show():
         </tr>
         </thead>
         <tbody>
-        {''.join(rows_html)}
+        {rows_html}
         </tbody>
     </table>
     </div>
@@ -1,11 +1,15 @@
 import streamlit as st
 import base64
+from pathlib import Path
+
+# Read the leaf icon once per process instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def _image_data_uri(path: str) -> str:
+    return "data:image/png;base64," + base64.b64encode(Path(path).read_bytes()).decode()
 
 def show():
     # Add leaf icon
-    with open("seeds_leaf.png", "rb") as img_file:
-        encoded_leaf_icon = base64.b64encode(img_file.read()).decode()
-    leaf_icon_html = f'<img src="data:image/png;base64,{encoded_leaf_icon}" alt="Leaf" width="38" style="vertical-align:-10px; margin-right:10px;">'
+    leaf_icon_html = f'<img src="{_image_data_uri("seeds_leaf.png")}" alt="Leaf" width="38" style="vertical-align:-10px; margin-right:10px;">'
 
     st.markdown(f"<h1>{leaf_icon_html}SEEDS Dashboard User Guide</h1>", unsafe_allow_html=True)
     